@@ -4,11 +4,88 @@ Core functionality for Tamil text tokenization and processing.
 
 import re
 import unicodedata
-from typing import List, Optional, Union, Dict, Tuple
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, List, Union, Dict, Tuple
 
 from .exceptions import InvalidTextError, TokenizationError
 
 
+# Patterns are compiled once at import and shared by every TamilTokenizer
+
+# Tamil Unicode ranges
+# Main Tamil block: U+0B80–U+0BFF
+# Tamil Supplement: U+11FC0–U+11FFF (not commonly used)
+_TAMIL_RE = re.compile(r'[\u0B80-\u0BFF]+')
+
+# Single Tamil code point, used to extract characters in one scan
+_TAMIL_CHAR_RE = re.compile(r'[\u0B80-\u0BFF]')
+
+# Tamil base consonants (க-ன், ப-ஹ)
+_CONSONANT_RE = re.compile(r'[\u0B95-\u0BB9]')
+
+# Tamil vowels (அ-ஔ)
+_VOWEL_RE = re.compile(r'[\u0B85-\u0B94]')
+
+# Tamil vowel signs (ா-ௌ)
+_VOWEL_SIGN_RE = re.compile(r'[\u0BBE-\u0BCC]')
+
+# Tamil combining marks (், ௗ)
+_COMBINING_RE = re.compile(r'[\u0BCD\u0BD7]')
+
+# Union of the four letter classes above
+_TAMIL_LETTER_RE = re.compile(r'[\u0B85-\u0BB9\u0BBE-\u0BCD\u0BD7]')
+
+# Common Tamil punctuation and sentence endings. A run of terminators such
+# as "..." or "?!" is one split point, so no empty pieces are produced.
+_SENTENCE_END_RE = re.compile(r'[.!?।॥]+')
+
+# Enhanced word pattern that handles Tamil script properly
+# This matches sequences of Tamil characters including combining marks
+_WORD_RE = re.compile(r'[\u0B80-\u0BFF]+|\d+|[.,!?]+(?:[\u0BCD\u0BD7][\u0B80-\u0BFF]*)*')
+
+# Conjunct consonants (consonant + virama + consonant)
+_CONJUNCT_RE = re.compile(r'[\u0B95-\u0BB9][\u0BCD][\u0B95-\u0BB9]')
+
+# Vowel signs including the au length mark (ா-ௌ, ௗ)
+_VOWEL_MARK_RE = re.compile(r'[\u0BBE-\u0BCC\u0BD7]')
+
+# Whitespace and punctuation patterns
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r'[^\u0B80-\u0BFF\s]')
+
+# A single consonant, or one of the two conjuncts Tamil writes as a ligature:
+# க்ஷ and the ஸ்ர of ஸ்ரீ. Any other virama ends the grapheme, so க்ஷ்மி
+# splits into க்ஷ் + மி and பக்கம் into ப + க் + க + ம்.
+_CONSONANT_CLUSTER = r'(?:\u0B95\u0BCD\u0BB7|\u0BB8\u0BCD\u0BB0(?=\u0BC0)|[\u0B95-\u0BB9])'
+
+# Tamil grapheme cluster pattern for proper character tokenization
+# This handles complex Tamil characters with combining marks. As in UAX #29,
+# every trailing mark (two-part vowel signs written as ெ + ௗ, a final virama)
+# stays with its consonant or independent vowel base, and a ZWJ/ZWNJ after a
+# virama breaks the conjunct. The consonant branch is tried first as it
+# matches most clusters.
+_GRAPHEME_RE = re.compile(
+    _CONSONANT_CLUSTER + r'[\u0BBE-\u0BCD\u0BD7]*|'  # Consonant or conjunct with vowel signs and virama
+    r'[\u0B85-\u0B94][\u0BBE-\u0BCD\u0BD7]*|'  # Independent vowels with any trailing marks
+    r'[\u0B80-\u0BFF]'  # Any other Tamil character
+)
+
+# Tamil syllables: V, CV and CCV. Unlike graphemes, a syllable keeps every
+# virama-joined consonant with the one that follows it (பக்கம் is ப + க்க +
+# ம்), plus at most one vowel sign or a final virama. Consonant clusters come
+# first because they are by far the most frequent; the vowel branch starts
+# with a disjoint character so order does not change what is matched.
+_SYLLABLE_RE = re.compile(
+    r'[\u0B95-\u0BB9](?:[\u0BCD][\u0B95-\u0BB9])*(?:[\u0BBE-\u0BCC\u0BD7]|[\u0BCD])?|'  # Consonant clusters with vowel signs or virama (C+V, CC+V)
+    r'[\u0B85-\u0B94]'  # Independent vowels (V)
+)
+
+# Inputs longer than this bypass the convenience-function and get_statistics
+# caches, so neither cache can pin large documents in memory
+_CACHE_MAX_TEXT_LENGTH = 1024
+
+
 class TamilTokenizer:
     """
     A class for Tamil text tokenization and processing.
@@ -20,44 +97,51 @@ class TamilTokenizer:
     - Text cleaning and normalization
     """
     
+    # Instances only hold references to the shared module-level patterns
+    __slots__ = (
+        'tamil_pattern',
+        'tamil_char_pattern',
+        'tamil_consonants',
+        'tamil_vowels',
+        'tamil_vowel_signs',
+        'tamil_combining',
+        'tamil_letter_pattern',
+        'sentence_endings',
+        'word_pattern',
+        'conjunct_pattern',
+        'vowel_mark_pattern',
+        'whitespace_pattern',
+        'punctuation_pattern',
+        'grapheme_pattern',
+        'syllable_pattern',
+    )
+    
+    # Tokenization methods accepted by tokenize(), mapped to their implementations
+    _METHODS = {
+        "words": "tokenize_words",
+        "sentences": "tokenize_sentences",
+        "characters": "tokenize_characters",
+        "syllables": "tokenize_syllables",
+        "graphemes": "tokenize_graphemes",
+    }
+    
     def __init__(self) -> None:
         """Initialize the Tamil tokenizer."""
-        # Tamil Unicode ranges
-        # Main Tamil block: U+0B80–U+0BFF
-        # Tamil Supplement: U+11FC0–U+11FFF (not commonly used)
-        self.tamil_pattern = re.compile(r'[\u0B80-\u0BFF]+')
-        
-        # Tamil base consonants (க-ன், ப-ஹ)
-        self.tamil_consonants = re.compile(r'[\u0B95-\u0BB9]')
-        
-        # Tamil vowels (அ-ஔ)
-        self.tamil_vowels = re.compile(r'[\u0B85-\u0B94]')
-        
-        # Tamil vowel signs (ா-ௌ)
-        self.tamil_vowel_signs = re.compile(r'[\u0BBE-\u0BCC]')
-        
-        # Tamil combining marks (், ௗ)
-        self.tamil_combining = re.compile(r'[\u0BCD\u0BD7]')
-        
-        # Common Tamil punctuation and sentence endings
-        self.sentence_endings = r'[.!?।॥]'
-        
-        # Enhanced word pattern that handles Tamil script properly
-        # This matches sequences of Tamil characters including combining marks
-        self.word_pattern = re.compile(r'[\u0B80-\u0BFF]+|\d+|[.,!?]+(?:[\u0BCD\u0BD7][\u0B80-\u0BFF]*)*')
-        
-        # Whitespace and punctuation patterns
-        self.whitespace_pattern = re.compile(r'\s+')
-        self.punctuation_pattern = re.compile(r'[^\u0B80-\u0BFF\s]')
-        
-        # Tamil grapheme cluster pattern for proper character tokenization
-        # This handles complex Tamil characters with combining marks
-        self.grapheme_pattern = re.compile(
-            r'[\u0B85-\u0B94]|'  # Independent vowels
-            r'[\u0B95-\u0BB9](?:[\u0BCD][\u0B95-\u0BB9])*[\u0BBE-\u0BCC\u0BD7]?|'  # Consonants with optional conjuncts and vowel signs
-            r'[\u0B95-\u0BB9][\u0BCD](?![\u0B95-\u0BB9])|'  # Consonant with virama (not followed by another consonant)
-            r'[\u0B80-\u0BFF]'  # Any other Tamil character
-        )
+        self.tamil_pattern = _TAMIL_RE
+        self.tamil_char_pattern = _TAMIL_CHAR_RE
+        self.tamil_consonants = _CONSONANT_RE
+        self.tamil_vowels = _VOWEL_RE
+        self.tamil_vowel_signs = _VOWEL_SIGN_RE
+        self.tamil_combining = _COMBINING_RE
+        self.tamil_letter_pattern = _TAMIL_LETTER_RE
+        self.sentence_endings = _SENTENCE_END_RE
+        self.word_pattern = _WORD_RE
+        self.conjunct_pattern = _CONJUNCT_RE
+        self.vowel_mark_pattern = _VOWEL_MARK_RE
+        self.whitespace_pattern = _WS_RE
+        self.punctuation_pattern = _PUNCT_RE
+        self.grapheme_pattern = _GRAPHEME_RE
+        self.syllable_pattern = _SYLLABLE_RE
     
     def _validate_text(self, text: Union[str, None]) -> str:
         """
@@ -67,7 +151,7 @@ class TamilTokenizer:
             text: Input text to validate
             
         Returns:
-            Validated text as string
+            Validated text as string, stripped and in Unicode NFC form
             
         Raises:
             InvalidTextError: If text is invalid
@@ -75,13 +159,20 @@ class TamilTokenizer:
         if text is None:
             raise InvalidTextError("Text cannot be None")
         
-        if not isinstance(text, str):
+        # Exact str is the common case; only subclasses need isinstance()
+        if type(text) is not str and not isinstance(text, str):
             raise InvalidTextError("Text must be a string")
         
-        if not text.strip():
+        stripped_text = text.strip()
+        if not stripped_text:
             raise InvalidTextError("Text cannot be empty or only whitespace")
         
-        return text.strip()
+        # Canonical composition makes precomposed and decomposed input (e.g.
+        # ௌ vs ெ + ௗ) tokenize identically; ASCII text is always in NFC
+        if not stripped_text.isascii():
+            stripped_text = unicodedata.normalize('NFC', stripped_text)
+        
+        return stripped_text
     
     def tokenize_words(self, text: str) -> List[str]:
         """
@@ -98,19 +189,56 @@ class TamilTokenizer:
             TokenizationError: If tokenization fails
         """
         try:
-            validated_text = self._validate_text(text)
+            return self._tokenize_words_nocheck(self._validate_text(text))
+            
+        except Exception as e:
+            if isinstance(e, (InvalidTextError, TokenizationError)):
+                raise
+            raise TokenizationError(f"Failed to tokenize words: {str(e)}")
+    
+    def _tokenize_words_nocheck(self, text: str) -> List[str]:
+        """
+        Tokenize already validated text into words.
+        
+        Args:
+            text: Text returned by _validate_text
             
-            # Find all Tamil word sequences
-            words = self.word_pattern.findall(validated_text)
+        Returns:
+            List of word tokens
+        """
+        # Find all Tamil word sequences. None of the word pattern's
+        # alternatives can match whitespace or an empty string, so the
+        # matches need no further cleanup.
+        return self.word_pattern.findall(text)
+    
+    def tokenize_words_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        Tokenize many Tamil texts into words in one call.
+        
+        Args:
+            texts: Tamil texts to tokenize
             
-            # Clean up words by removing extra whitespace
-            cleaned_words = []
-            for word in words:
-                cleaned_word = re.sub(r'\s+', ' ', word.strip())
-                if cleaned_word:
-                    cleaned_words.append(cleaned_word)
+        Returns:
+            List of word token lists, one per input text
             
-            return cleaned_words
+        Raises:
+            InvalidTextError: If texts is a string or any text is invalid
+            TokenizationError: If tokenization fails
+        """
+        try:
+            # A single string is iterable too, but would be tokenized one
+            # character at a time
+            if isinstance(texts, str):
+                raise InvalidTextError("Texts must be a list of strings")
+            
+            validated_texts = [self._validate_text(text) for text in texts]
+            
+            # Validate everything up front, then run the bound findall per
+            # text; this skips the per-call dispatch and error handling of
+            # tokenize_words and is faster than bucketing finditer matches
+            # over a single joined buffer in Python
+            findall = self.word_pattern.findall
+            return [findall(text) for text in validated_texts]
             
         except Exception as e:
             if isinstance(e, (InvalidTextError, TokenizationError)):
@@ -132,25 +260,35 @@ class TamilTokenizer:
             TokenizationError: If tokenization fails
         """
         try:
-            validated_text = self._validate_text(text)
-            
-            # Split by sentence endings
-            sentences = re.split(self.sentence_endings, validated_text)
-            
-            # Clean up sentences
-            cleaned_sentences = []
-            for sentence in sentences:
-                cleaned_sentence = sentence.strip()
-                if cleaned_sentence:
-                    cleaned_sentences.append(cleaned_sentence)
-            
-            return cleaned_sentences
+            return self._tokenize_sentences_nocheck(self._validate_text(text))
             
         except Exception as e:
             if isinstance(e, (InvalidTextError, TokenizationError)):
                 raise
             raise TokenizationError(f"Failed to tokenize sentences: {str(e)}")
     
+    def _tokenize_sentences_nocheck(self, text: str) -> List[str]:
+        """
+        Tokenize already validated text into sentences.
+        
+        Args:
+            text: Text returned by _validate_text
+            
+        Returns:
+            List of sentence tokens
+        """
+        # Split by sentence endings
+        sentences = self.sentence_endings.split(text)
+        
+        # Clean up sentences
+        cleaned_sentences = []
+        for sentence in sentences:
+            cleaned_sentence = sentence.strip()
+            if cleaned_sentence:
+                cleaned_sentences.append(cleaned_sentence)
+        
+        return cleaned_sentences
+    
     def tokenize_characters(self, text: str) -> List[str]:
         """
         Tokenize Tamil text into individual Unicode characters.
@@ -169,21 +307,26 @@ class TamilTokenizer:
             TokenizationError: If tokenization fails
         """
         try:
-            validated_text = self._validate_text(text)
-            
-            # Extract individual Tamil characters
-            characters = []
-            for char in validated_text:
-                if self.tamil_pattern.match(char):
-                    characters.append(char)
-            
-            return characters
+            return self._tokenize_characters_nocheck(self._validate_text(text))
             
         except Exception as e:
             if isinstance(e, (InvalidTextError, TokenizationError)):
                 raise
             raise TokenizationError(f"Failed to tokenize characters: {str(e)}")
     
+    def _tokenize_characters_nocheck(self, text: str) -> List[str]:
+        """
+        Tokenize already validated text into individual Tamil characters.
+        
+        Args:
+            text: Text returned by _validate_text
+            
+        Returns:
+            List of individual Tamil Unicode characters
+        """
+        # Extract individual Tamil characters in a single scan
+        return self.tamil_char_pattern.findall(text)
+    
     def tokenize_graphemes(self, text: str) -> List[str]:
         """
         Tokenize Tamil text into grapheme clusters (logical characters).
@@ -202,24 +345,28 @@ class TamilTokenizer:
             TokenizationError: If tokenization fails
         """
         try:
-            validated_text = self._validate_text(text)
-            
-            # Use grapheme pattern to extract proper Tamil character clusters
-            graphemes = self.grapheme_pattern.findall(validated_text)
-            
-            # Filter out empty matches and non-Tamil characters
-            filtered_graphemes = []
-            for grapheme in graphemes:
-                if grapheme and self.tamil_pattern.match(grapheme):
-                    filtered_graphemes.append(grapheme)
-            
-            return filtered_graphemes
+            return self._tokenize_graphemes_nocheck(self._validate_text(text))
             
         except Exception as e:
             if isinstance(e, (InvalidTextError, TokenizationError)):
                 raise
             raise TokenizationError(f"Failed to tokenize graphemes: {str(e)}")
     
+    def _tokenize_graphemes_nocheck(self, text: str) -> List[str]:
+        """
+        Tokenize already validated text into grapheme clusters.
+        
+        Args:
+            text: Text returned by _validate_text
+            
+        Returns:
+            List of grapheme cluster tokens
+        """
+        # Use grapheme pattern to extract proper Tamil character clusters.
+        # Every alternative consumes at least one character and starts with
+        # a Tamil code point, so the matches need no filtering.
+        return self.grapheme_pattern.findall(text)
+    
     def clean_text(self, text: str, remove_punctuation: bool = False) -> str:
         """
         Clean Tamil text by normalizing whitespace and optionally removing punctuation.
@@ -235,22 +382,33 @@ class TamilTokenizer:
             InvalidTextError: If text is invalid
         """
         try:
-            validated_text = self._validate_text(text)
-            
-            # Normalize whitespace
-            cleaned_text = self.whitespace_pattern.sub(' ', validated_text)
-            
-            # Remove punctuation if requested
-            if remove_punctuation:
-                cleaned_text = self.punctuation_pattern.sub('', cleaned_text)
-            
-            return cleaned_text.strip()
+            return self._clean_text_nocheck(self._validate_text(text), remove_punctuation)
             
         except Exception as e:
             if isinstance(e, InvalidTextError):
                 raise
             raise TokenizationError(f"Failed to clean text: {str(e)}")
     
+    def _clean_text_nocheck(self, text: str, remove_punctuation: bool = False) -> str:
+        """
+        Clean text without validating or NFC-normalizing it first.
+        
+        Args:
+            text: Text to clean
+            remove_punctuation: Whether to remove non-Tamil punctuation
+            
+        Returns:
+            Cleaned text
+        """
+        # Normalize whitespace
+        cleaned_text = self.whitespace_pattern.sub(' ', text)
+        
+        # Remove punctuation if requested
+        if remove_punctuation:
+            cleaned_text = self.punctuation_pattern.sub('', cleaned_text)
+        
+        return cleaned_text.strip()
+    
     def normalize_text(self, text: str, form: str = "NFC", 
                       standardize_digits: bool = True,
                       standardize_punctuation: bool = True,
@@ -298,8 +456,11 @@ class TamilTokenizer:
             if standardize_punctuation:
                 normalized_text = self._standardize_punctuation(normalized_text)
             
-            # Step 5: Clean whitespace
-            normalized_text = self.clean_text(normalized_text)
+            # Step 5: Clean whitespace. clean_text() would re-validate and
+            # recompose the text to NFC, undoing any other requested form.
+            normalized_text = self._clean_text_nocheck(normalized_text)
+            if not normalized_text:
+                raise InvalidTextError("Text cannot be empty or only whitespace")
             
             return normalized_text
             
@@ -374,18 +535,12 @@ class TamilTokenizer:
         """
         method = method.lower()
         
-        if method == "words":
-            return self.tokenize_words(text)
-        elif method == "sentences":
-            return self.tokenize_sentences(text)
-        elif method == "characters":
-            return self.tokenize_characters(text)
-        elif method == "syllables":
-            return self.tokenize_syllables(text)
-        elif method == "graphemes":
-            return self.tokenize_graphemes(text)
-        else:
+        method_name = self._METHODS.get(method)
+        if method_name is None:
             raise TokenizationError(f"Unknown tokenization method: {method}")
+        
+        tokenize_method: Callable[[str], List[str]] = getattr(self, method_name)
+        return tokenize_method(text)
     
     def tokenize_syllables(self, text: str) -> List[str]:
         """
@@ -407,27 +562,27 @@ class TamilTokenizer:
             TokenizationError: If tokenization fails
         """
         try:
-            validated_text = self._validate_text(text)
-            
-            # Pattern for Tamil syllables
-            syllable_pattern = re.compile(
-                r'[\u0B85-\u0B94]|'  # Independent vowels (V)
-                r'[\u0B95-\u0BB9](?:[\u0BCD][\u0B95-\u0BB9])*(?:[\u0BBE-\u0BCC]|[\u0BD7])?|'  # Consonant clusters with vowel signs (C+V, CC+V)
-                r'[\u0B95-\u0BB9][\u0BCD](?![\u0B95-\u0BB9])'  # Consonant with virama at end
-            )
-            
-            syllables = syllable_pattern.findall(validated_text)
-            
-            # Filter out empty matches
-            filtered_syllables = [syl for syl in syllables if syl and self.tamil_pattern.match(syl)]
-            
-            return filtered_syllables
+            return self._tokenize_syllables_nocheck(self._validate_text(text))
             
         except Exception as e:
             if isinstance(e, (InvalidTextError, TokenizationError)):
                 raise
             raise TokenizationError(f"Failed to tokenize syllables: {str(e)}")
     
+    def _tokenize_syllables_nocheck(self, text: str) -> List[str]:
+        """
+        Tokenize already validated text into syllables.
+        
+        Args:
+            text: Text returned by _validate_text
+            
+        Returns:
+            List of syllable tokens
+        """
+        # Every alternative consumes at least one character and starts with
+        # a Tamil code point, so the matches need no filtering
+        return self.syllable_pattern.findall(text)
+    
     def analyze_word_structure(self, word: str) -> dict:
         """
         Analyze the structure of a Tamil word.
@@ -439,6 +594,11 @@ class TamilTokenizer:
             Dictionary containing word structure analysis
         """
         try:
+            # Compose as _validate_text does, so decomposed vowel signs give
+            # the same characters and syllables as tokenize_characters()
+            if word and not word.isascii():
+                word = unicodedata.normalize('NFC', word)
+            
             if not word or not self.tamil_pattern.match(word):
                 return {
                     'is_tamil': False,
@@ -450,14 +610,14 @@ class TamilTokenizer:
                     'has_vowel_signs': False
                 }
             
-            characters = self.tokenize_characters(word)
-            syllables = self.tokenize_syllables(word)
+            characters = self._tokenize_characters_nocheck(word)
+            syllables = self._tokenize_syllables_nocheck(word)
             
             # Check for conjuncts (consonant clusters)
-            has_conjuncts = bool(re.search(r'[\u0B95-\u0BB9][\u0BCD][\u0B95-\u0BB9]', word))
+            has_conjuncts = bool(self.conjunct_pattern.search(word))
             
             # Check for vowel signs
-            has_vowel_signs = bool(re.search(r'[\u0BBE-\u0BCC\u0BD7]', word))
+            has_vowel_signs = bool(self.vowel_mark_pattern.search(word))
             
             return {
                 'is_tamil': True,
@@ -485,40 +645,88 @@ class TamilTokenizer:
         try:
             validated_text = self._validate_text(text)
             
-            words = self.tokenize_words(validated_text)
-            sentences = self.tokenize_sentences(validated_text)
-            characters = self.tokenize_characters(validated_text)
-            syllables = self.tokenize_syllables(validated_text)
-            
-            # Analyze word structures
-            word_structures = [self.analyze_word_structure(word) for word in words]
-            tamil_words = [ws for ws in word_structures if ws['is_tamil']]
+            # Large documents are kept out of the cache, and subclasses and
+            # instances with replaced patterns can produce different
+            # statistics, so only plain tokenizers share the cache
+            if (
+                len(validated_text) > _CACHE_MAX_TEXT_LENGTH
+                or type(self) is not TamilTokenizer
+                or not self._has_default_statistics_patterns()
+            ):
+                return self._get_statistics_nocheck(validated_text)
             
-            # Count conjuncts and vowel signs
-            words_with_conjuncts = sum(1 for ws in tamil_words if ws['has_conjuncts'])
-            words_with_vowel_signs = sum(1 for ws in tamil_words if ws['has_vowel_signs'])
-            
-            return {
-                'total_characters': len(validated_text),
-                'tamil_characters': len(characters),
-                'words': len(words),
-                'tamil_words': len(tamil_words),
-                'sentences': len(sentences),
-                'syllables': len(syllables),
-                'average_word_length': sum(len(word) for word in words) / len(words) if words else 0,
-                'average_sentence_length': len(words) / len(sentences) if sentences else 0,
-                'average_syllables_per_word': len(syllables) / len(words) if words else 0,
-                'words_with_conjuncts': words_with_conjuncts,
-                'words_with_vowel_signs': words_with_vowel_signs,
-                'conjunct_percentage': (words_with_conjuncts / len(tamil_words) * 100) if tamil_words else 0,
-                'vowel_sign_percentage': (words_with_vowel_signs / len(tamil_words) * 100) if tamil_words else 0,
-            }
+            return dict(_cached_statistics(validated_text))
             
         except Exception as e:
             if isinstance(e, InvalidTextError):
                 raise
             raise TokenizationError(f"Failed to get statistics: {str(e)}")
     
+    # Patterns read by _get_statistics_nocheck, with the shared defaults the
+    # statistics cache was computed with
+    _STATISTICS_PATTERNS = {
+        'word_pattern': _WORD_RE,
+        'sentence_endings': _SENTENCE_END_RE,
+        'tamil_pattern': _TAMIL_RE,
+        'syllable_pattern': _SYLLABLE_RE,
+        'conjunct_pattern': _CONJUNCT_RE,
+        'vowel_mark_pattern': _VOWEL_MARK_RE,
+    }
+    
+    def _has_default_statistics_patterns(self) -> bool:
+        """
+        Check whether this instance computes statistics with the shared patterns.
+        
+        Returns:
+            True if every pattern _get_statistics_nocheck reads is the default
+        """
+        return all(
+            getattr(self, name) is pattern
+            for name, pattern in self._STATISTICS_PATTERNS.items()
+        )
+    
+    def _get_statistics_nocheck(self, text: str) -> dict:
+        """
+        Compute statistics for already validated text.
+        
+        Args:
+            text: Text returned by _validate_text
+            
+        Returns:
+            Dictionary containing text statistics
+        """
+        words = self._tokenize_words_nocheck(text)
+        sentences = self._tokenize_sentences_nocheck(text)
+        
+        # Only counts are needed for characters and syllables, so avoid
+        # building a token list with one string per match
+        tamil_char_count = len(text) - len(self.tamil_pattern.sub('', text))
+        syllable_count = self.syllable_pattern.subn('', text)[1]
+        
+        # Classify words directly instead of running a full
+        # analyze_word_structure() (and its re-tokenization) per word
+        tamil_words = list(filter(self.tamil_pattern.match, words))
+        
+        # Count conjuncts and vowel signs
+        words_with_conjuncts = len(list(filter(self.conjunct_pattern.search, tamil_words)))
+        words_with_vowel_signs = len(list(filter(self.vowel_mark_pattern.search, tamil_words)))
+        
+        return {
+            'total_characters': len(text),
+            'tamil_characters': tamil_char_count,
+            'words': len(words),
+            'tamil_words': len(tamil_words),
+            'sentences': len(sentences),
+            'syllables': syllable_count,
+            'average_word_length': sum(map(len, words)) / len(words) if words else 0,
+            'average_sentence_length': len(words) / len(sentences) if sentences else 0,
+            'average_syllables_per_word': syllable_count / len(words) if words else 0,
+            'words_with_conjuncts': words_with_conjuncts,
+            'words_with_vowel_signs': words_with_vowel_signs,
+            'conjunct_percentage': (words_with_conjuncts / len(tamil_words) * 100) if tamil_words else 0,
+            'vowel_sign_percentage': (words_with_vowel_signs / len(tamil_words) * 100) if tamil_words else 0,
+        }
+    
     def get_script_info(self, text: str) -> Dict[str, Union[int, float, bool, List[str], Dict[str, int]]]:
         """
         Get comprehensive script information about the text.
@@ -538,7 +746,7 @@ class TamilTokenizer:
             
             # Basic character analysis
             total_chars = len(validated_text)
-            tamil_chars = len(self.tokenize_characters(validated_text))
+            tamil_chars = len(self._tokenize_characters_nocheck(validated_text))
             
             # Script detection
             scripts: Dict[str, int] = self._detect_scripts(validated_text)
@@ -571,7 +779,7 @@ class TamilTokenizer:
                 'character_types': char_types,
                 'complexity_score': complexity_score,
                 'unicode_blocks': self._identify_unicode_blocks(validated_text),
-                'has_conjuncts': bool(re.search(r'[\u0B95-\u0BB9][\u0BCD][\u0B95-\u0BB9]', validated_text)),
+                'has_conjuncts': bool(self.conjunct_pattern.search(validated_text)),
                 'has_tamil_numerals': bool(re.search(r'[௦-௯]', validated_text)),
                 'has_mixed_numerals': self._has_mixed_numerals(validated_text),
             }
@@ -596,14 +804,17 @@ class TamilTokenizer:
         """
         scripts: Dict[str, int] = {}
         
-        for char in text:
+        # Classify each distinct character once and weight it by its count;
+        # Counter does the per-character pass in C
+        for char, count in Counter(text).items():
             if char.isspace():
                 continue
                 
             # Get Unicode script name
             try:
-                script_name = unicodedata.name(char, '').split()[0]
-                if 'TAMIL' in unicodedata.name(char, ''):
+                char_name = unicodedata.name(char, '')
+                script_name = char_name.split()[0]
+                if 'TAMIL' in char_name:
                     script_name = 'Tamil'
                 elif char.isascii() and char.isalpha():
                     script_name = 'Latin'
@@ -623,10 +834,10 @@ class TamilTokenizer:
                     else:
                         script_name = 'Other'
                         
-                scripts[script_name] = scripts.get(script_name, 0) + 1
+                scripts[script_name] = scripts.get(script_name, 0) + count
                 
             except Exception:
-                scripts['Unknown'] = scripts.get('Unknown', 0) + 1
+                scripts['Unknown'] = scripts.get('Unknown', 0) + count
         
         return scripts
     
@@ -640,29 +851,25 @@ class TamilTokenizer:
         Returns:
             Dictionary mapping character types to counts
         """
+        # The Tamil letter classes are disjoint, so count them in bulk
+        # rather than matching every character against each pattern
         char_types = {
-            'vowels': 0,
-            'consonants': 0,
-            'vowel_signs': 0,
-            'combining_marks': 0,
+            'vowels': len(self.tamil_vowels.findall(text)),
+            'consonants': len(self.tamil_consonants.findall(text)),
+            'vowel_signs': len(self.tamil_vowel_signs.findall(text)),
+            'combining_marks': len(self.tamil_combining.findall(text)),
             'digits': 0,
             'punctuation': 0,
             'whitespace': 0,
             'other': 0
         }
         
-        for char in text:
+        # Classify whatever is left once the Tamil letters are removed
+        # (Tamil numerals ௦-௯ are covered by str.isdigit())
+        for char in self.tamil_letter_pattern.sub('', text):
             if char.isspace():
                 char_types['whitespace'] += 1
-            elif self.tamil_vowels.match(char):
-                char_types['vowels'] += 1
-            elif self.tamil_consonants.match(char):
-                char_types['consonants'] += 1
-            elif self.tamil_vowel_signs.match(char):
-                char_types['vowel_signs'] += 1
-            elif self.tamil_combining.match(char):
-                char_types['combining_marks'] += 1
-            elif char.isdigit() or re.match(r'[௦-௯]', char):
+            elif char.isdigit():
                 char_types['digits'] += 1
             elif not char.isalnum():
                 char_types['punctuation'] += 1
@@ -693,7 +900,7 @@ class TamilTokenizer:
             score += (unique_chars / total_chars) * 2
         
         # Conjunct consonants add complexity
-        conjuncts = len(re.findall(r'[\u0B95-\u0BB9][\u0BCD][\u0B95-\u0BB9]', text))
+        conjuncts = len(self.conjunct_pattern.findall(text))
         score += min(conjuncts * 0.5, 2.0)
         
         # Vowel signs add moderate complexity
@@ -701,7 +908,7 @@ class TamilTokenizer:
         score += min(vowel_signs * 0.2, 1.5)
         
         # Long words add complexity
-        words = self.tokenize_words(text)
+        words = self._tokenize_words_nocheck(text)
         if words:
             avg_word_length = sum(len(word) for word in words) / len(words)
             score += min(avg_word_length * 0.1, 2.0)
@@ -747,7 +954,7 @@ class TamilTokenizer:
         """
         blocks = set()
         
-        for char in text:
+        for char in set(text):
             code_point = ord(char)
             
             if 0x0B80 <= code_point <= 0x0BFF:
@@ -871,16 +1078,58 @@ class TamilTokenizer:
             return False
 
 
-# Global instance for convenience functions
-_default_tokenizer: Optional[TamilTokenizer] = None
+# Global instance for convenience functions. Construction only binds the
+# precompiled module-level patterns, so it is created eagerly at import.
+_default_tokenizer = TamilTokenizer()
 
 
-def _get_default_tokenizer() -> TamilTokenizer:
-    """Get or create the default TamilTokenizer instance."""
-    global _default_tokenizer
-    if _default_tokenizer is None:
-        _default_tokenizer = TamilTokenizer()
-    return _default_tokenizer
+@lru_cache(maxsize=4096)
+def _cached_tokenize(method: str, text: str) -> Tuple[str, ...]:
+    """
+    Tokenize validated text with the default tokenizer and cache the result.
+    
+    Args:
+        method: Tokenization method ("words", "sentences", "characters", "syllables", "graphemes")
+        text: Text returned by _validate_text
+        
+    Returns:
+        Tuple of tokens, so cached results cannot be mutated by callers
+    """
+    tokenize = getattr(_default_tokenizer, f"_tokenize_{method}_nocheck")
+    return tuple(tokenize(text))
+
+
+def _tokenize_with_cache(method: str, text: str) -> List[str]:
+    """
+    Validate text and tokenize it through the convenience-function cache.
+    
+    Args:
+        method: Tokenization method ("words", "sentences", "characters", "syllables", "graphemes")
+        text: Text to tokenize
+        
+    Returns:
+        List of tokens
+    """
+    validated_text = _default_tokenizer._validate_text(text)
+    if len(validated_text) > _CACHE_MAX_TEXT_LENGTH:
+        tokenize: Callable[[str], List[str]] = getattr(_default_tokenizer, f"_tokenize_{method}_nocheck")
+        return tokenize(validated_text)
+    return list(_cached_tokenize(method, validated_text))
+
+
+@lru_cache(maxsize=128)
+def _cached_statistics(text: str) -> dict:
+    """
+    Compute statistics for validated text with the default tokenizer and cache them.
+    
+    Args:
+        text: Text returned by _validate_text
+        
+    Returns:
+        Dictionary containing text statistics; callers must copy it before
+        handing it out
+    """
+    return _default_tokenizer._get_statistics_nocheck(text)
 
 
 # Convenience functions
@@ -894,7 +1143,7 @@ def tokenize_words(text: str) -> List[str]:
     Returns:
         List of word tokens
     """
-    return _get_default_tokenizer().tokenize_words(text)
+    return _tokenize_with_cache("words", text)
 
 
 def tokenize_sentences(text: str) -> List[str]:
@@ -907,7 +1156,7 @@ def tokenize_sentences(text: str) -> List[str]:
     Returns:
         List of sentence tokens
     """
-    return _get_default_tokenizer().tokenize_sentences(text)
+    return _tokenize_with_cache("sentences", text)
 
 
 def tokenize_characters(text: str) -> List[str]:
@@ -920,7 +1169,7 @@ def tokenize_characters(text: str) -> List[str]:
     Returns:
         List of character tokens
     """
-    return _get_default_tokenizer().tokenize_characters(text)
+    return _tokenize_with_cache("characters", text)
 
 
 def tokenize_syllables(text: str) -> List[str]:
@@ -933,7 +1182,7 @@ def tokenize_syllables(text: str) -> List[str]:
     Returns:
         List of syllable tokens
     """
-    return _get_default_tokenizer().tokenize_syllables(text)
+    return _tokenize_with_cache("syllables", text)
 
 
 def tokenize_graphemes(text: str) -> List[str]:
@@ -946,7 +1195,7 @@ def tokenize_graphemes(text: str) -> List[str]:
     Returns:
         List of grapheme cluster tokens
     """
-    return _get_default_tokenizer().tokenize_graphemes(text)
+    return _tokenize_with_cache("graphemes", text)
 
 
 def clean_text(text: str, remove_punctuation: bool = False) -> str:
@@ -960,7 +1209,7 @@ def clean_text(text: str, remove_punctuation: bool = False) -> str:
     Returns:
         Cleaned text
     """
-    return _get_default_tokenizer().clean_text(text, remove_punctuation)
+    return _default_tokenizer.clean_text(text, remove_punctuation)
 
 
 def normalize_text(text: str, form: str = "NFC", 
@@ -980,7 +1229,7 @@ def normalize_text(text: str, form: str = "NFC",
     Returns:
         Normalized text
     """
-    return _get_default_tokenizer().normalize_text(text, form, standardize_digits, standardize_punctuation, remove_zero_width)
+    return _default_tokenizer.normalize_text(text, form, standardize_digits, standardize_punctuation, remove_zero_width)
 
 
 def get_script_info(text: str) -> Dict[str, Union[int, float, bool, List[str], Dict[str, int]]]:
@@ -993,7 +1242,7 @@ def get_script_info(text: str) -> Dict[str, Union[int, float, bool, List[str], D
     Returns:
         Dictionary containing script information
     """
-    return _get_default_tokenizer().get_script_info(text)
+    return _default_tokenizer.get_script_info(text)
 
 
 def detect_language(text: str) -> Dict[str, Union[str, float, bool]]:
@@ -1006,7 +1255,7 @@ def detect_language(text: str) -> Dict[str, Union[str, float, bool]]:
     Returns:
         Dictionary containing language detection results
     """
-    return _get_default_tokenizer().detect_language(text)
+    return _default_tokenizer.detect_language(text)
 
 
 def is_valid_tamil_text(text: str, min_tamil_percentage: float = 50.0) -> bool:
@@ -1020,4 +1269,4 @@ def is_valid_tamil_text(text: str, min_tamil_percentage: float = 50.0) -> bool:
     Returns:
         True if text meets Tamil validation criteria
     """
-    return _get_default_tokenizer().is_valid_tamil_text(text, min_tamil_percentage)
+    return _default_tokenizer.is_valid_tamil_text(text, min_tamil_percentage)
@@ -0,0 +1,27 @@
+"""
+Shared fixtures for tamil-tokenizer tests.
+"""
+
+import re
+
+import pytest
+
+
+@pytest.fixture
+def regex_compile_calls(monkeypatch):
+    """
+    Record every pattern compiled through the re module during a test.
+    
+    re.compile() and the module-level helpers that take string patterns
+    (re.split, re.sub, ...) all go through re._compile, so patching it
+    catches any pattern built at call time instead of at import.
+    """
+    calls = []
+    original_compile = re._compile
+    
+    def recording_compile(pattern, *args, **kwargs):
+        calls.append(pattern)
+        return original_compile(pattern, *args, **kwargs)
+    
+    monkeypatch.setattr(re, "_compile", recording_compile)
+    return calls
@@ -10,10 +10,7 @@ from tamil_tokenizer import (
     detect_language,
     is_valid_tamil_text,
 )
-from tamil_tokenizer.exceptions import (
-    InvalidTextError,
-    TokenizationError,
-)
+from tamil_tokenizer.exceptions import InvalidTextError
 
 
 class TestTextNormalization:
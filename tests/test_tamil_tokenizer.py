@@ -2,8 +2,11 @@
 Tests for tamil-tokenizer library.
 """
 
+import re
+import time
+import unicodedata
+
 import pytest
-from unittest.mock import patch
 
 from tamil_tokenizer import (
     TamilTokenizer,
@@ -15,48 +18,49 @@ from tamil_tokenizer import (
     clean_text,
     normalize_text,
 )
+from tamil_tokenizer import core
 from tamil_tokenizer.exceptions import (
     InvalidTextError,
     TokenizationError,
 )
 
 
+@pytest.fixture(scope="module")
+def tokenizer():
+    """Shared TamilTokenizer instance for the tests in this module."""
+    return TamilTokenizer()
+
+
 class TestTextValidation:
     """Test text validation functionality."""
     
-    def test_valid_text(self):
+    def test_valid_text(self, tokenizer):
         """Test valid Tamil text."""
-        tokenizer = TamilTokenizer()
         result = tokenizer._validate_text("தமிழ் மொழி")
         assert result == "தமிழ் மொழி"
     
-    def test_text_with_whitespace(self):
+    def test_text_with_whitespace(self, tokenizer):
         """Test text with leading/trailing whitespace."""
-        tokenizer = TamilTokenizer()
         result = tokenizer._validate_text("  தமிழ் மொழி  ")
         assert result == "தமிழ் மொழி"
     
-    def test_none_text(self):
+    def test_none_text(self, tokenizer):
         """Test None text."""
-        tokenizer = TamilTokenizer()
         with pytest.raises(InvalidTextError):
             tokenizer._validate_text(None)
     
-    def test_empty_text(self):
+    def test_empty_text(self, tokenizer):
         """Test empty text."""
-        tokenizer = TamilTokenizer()
         with pytest.raises(InvalidTextError):
             tokenizer._validate_text("")
     
-    def test_whitespace_only_text(self):
+    def test_whitespace_only_text(self, tokenizer):
         """Test whitespace-only text."""
-        tokenizer = TamilTokenizer()
         with pytest.raises(InvalidTextError):
             tokenizer._validate_text("   ")
     
-    def test_non_string_text(self):
+    def test_non_string_text(self, tokenizer):
         """Test non-string text."""
-        tokenizer = TamilTokenizer()
         with pytest.raises(InvalidTextError):
             tokenizer._validate_text(123)
 
@@ -64,74 +68,104 @@ class TestTextValidation:
 class TestWordTokenization:
     """Test word tokenization functionality."""
     
-    def test_simple_word_tokenization(self):
+    def test_simple_word_tokenization(self, tokenizer):
         """Test simple word tokenization."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize_words("தமிழ் மொழி அழகான மொழி")
         assert len(result) == 4
         assert "தமிழ்" in result
         assert "மொழி" in result
         assert "அழகான" in result
     
-    def test_single_word(self):
+    def test_single_word(self, tokenizer):
         """Test single word tokenization."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize_words("தமிழ்")
         assert len(result) == 1
         assert result[0] == "தமிழ்"
     
-    def test_words_with_extra_spaces(self):
+    def test_words_with_extra_spaces(self, tokenizer):
         """Test words with extra spaces."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize_words("தமிழ்   மொழி")
         assert len(result) == 2
         assert "தமிழ்" in result
         assert "மொழி" in result
     
-    def test_convenience_function(self):
-        """Test convenience function for word tokenization."""
-        result = tokenize_words("தமிழ் மொழி")
-        assert len(result) == 2
-        assert "தமிழ்" in result
-        assert "மொழி" in result
+    def test_tokenize_words_tabs_newlines(self, tokenizer):
+        """Test that any whitespace separates words."""
+        result = tokenizer.tokenize_words("தமிழ்\t\nமொழி")
+        assert result == ["தமிழ்", "மொழி"]
+    
+    def test_tokenize_words_punctuation_and_digits(self, tokenizer):
+        """Test that punctuation and digits are separate tokens, unlike str.split()."""
+        result = tokenizer.tokenize_words("தமிழ், மொழி! 12")
+        assert result == ["தமிழ்", ",", "மொழி", "!", "12"]
+    
+    def test_batch_word_tokenization(self, tokenizer):
+        """Test batch word tokenization."""
+        texts = ["தமிழ் மொழி", "  வணக்கம்  ", "அழகான மொழி 123"]
+        result = tokenizer.tokenize_words_batch(texts)
+        assert result == [tokenizer.tokenize_words(text) for text in texts]
+        assert tokenizer.tokenize_words_batch([]) == []
+    
+    def test_batch_word_tokenization_invalid_text(self, tokenizer):
+        """Test that batch word tokenization rejects invalid texts."""
+        with pytest.raises(InvalidTextError):
+            tokenizer.tokenize_words_batch(["தமிழ்", "   "])
+    
+    def test_batch_word_tokenization_rejects_string(self, tokenizer):
+        """Test that batch word tokenization rejects a single string."""
+        with pytest.raises(InvalidTextError, match="Texts must be a list of strings"):
+            tokenizer.tokenize_words_batch("தமிழ்")
+        
+        with pytest.raises(InvalidTextError, match="Texts must be a list of strings"):
+            tokenizer.tokenize_words_batch("தமிழ் மொழி")
+    
+    def test_convenience_function_repeated_calls(self):
+        """Test that repeated convenience calls return independent lists."""
+        first = tokenize_words("தமிழ் மொழி")
+        first.append("அழகு")
+        second = tokenize_words("தமிழ் மொழி")
+        assert second == ["தமிழ்", "மொழி"]
+        assert second is not first
 
 
 class TestSentenceTokenization:
     """Test sentence tokenization functionality."""
     
-    def test_simple_sentence_tokenization(self):
+    def test_simple_sentence_tokenization(self, tokenizer):
         """Test simple sentence tokenization."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize_sentences("வணக்கம். நீங்கள் எப்படி இருக்கிறீர்கள்?")
         assert len(result) == 2
         assert "வணக்கம்" in result[0]
         assert "நீங்கள்" in result[1]
     
-    def test_single_sentence(self):
+    def test_single_sentence(self, tokenizer):
         """Test single sentence."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize_sentences("தமிழ் அழகான மொழி")
         assert len(result) == 1
         assert result[0] == "தமிழ் அழகான மொழி"
     
-    def test_sentences_with_different_endings(self):
+    def test_sentences_with_different_endings(self, tokenizer):
         """Test sentences with different ending punctuation."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize_sentences("வணக்கம்! நலமா? நன்றாக இருக்கிறேன்.")
         assert len(result) == 3
     
-    def test_convenience_function(self):
-        """Test convenience function for sentence tokenization."""
-        result = tokenize_sentences("வணக்கம். நலமா?")
-        assert len(result) == 2
+    def test_tokenize_sentences_mixed_terminators(self, tokenizer):
+        """Test sentences ending in each supported terminator."""
+        result = tokenizer.tokenize_sentences("அ। ஆ॥ இ. ஈ! உ?")
+        assert result == ["அ", "ஆ", "இ", "ஈ", "உ"]
+    
+    def test_tokenize_sentences_ellipsis(self, tokenizer):
+        """Test that a run of terminators ends a single sentence."""
+        result = tokenizer.tokenize_sentences("அ... ஆ.")
+        assert result == ["அ", "ஆ"]
+        assert tokenizer.tokenize_sentences("நலமா?! சரி") == ["நலமா", "சரி"]
 
 
 class TestCharacterTokenization:
     """Test character tokenization functionality."""
     
-    def test_simple_character_tokenization(self):
+    def test_simple_character_tokenization(self, tokenizer):
         """Test simple character tokenization."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize_characters("தமிழ்")
         assert len(result) == 5  # த, ம, ி, ழ, ்
         assert "த" in result
@@ -140,80 +174,115 @@ class TestCharacterTokenization:
         assert "ழ" in result
         assert "்" in result
     
-    def test_characters_with_spaces(self):
+    def test_characters_with_spaces(self, tokenizer):
         """Test character tokenization with spaces (should ignore spaces)."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize_characters("த மி")
         assert len(result) == 3  # த, ம, ி
         assert "த" in result
         assert "ம" in result
         assert "ி" in result
     
-    def test_convenience_function(self):
-        """Test convenience function for character tokenization."""
-        result = tokenize_characters("தமிழ்")
-        assert len(result) >= 3  # At least த, ம, ழ்
+    def test_character_tokenization_uses_precompiled_patterns(self, tokenizer, regex_compile_calls):
+        """Test that character tokenization compiles no patterns per call."""
+        for text in ["தமிழ்", "த மி", "தமிழ் மொழி அழகான மொழி"]:
+            tokenizer.tokenize_characters(text)
+        assert regex_compile_calls == []
 
 
 class TestTextCleaning:
     """Test text cleaning functionality."""
     
-    def test_clean_text_whitespace(self):
+    def test_clean_text_whitespace(self, tokenizer):
         """Test cleaning text with extra whitespace."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.clean_text("தமிழ்   மொழி   அழகு")
         assert result == "தமிழ் மொழி அழகு"
     
-    def test_clean_text_with_punctuation(self):
+    def test_clean_text_with_punctuation(self, tokenizer):
         """Test cleaning text with punctuation removal."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.clean_text("தமிழ், மொழி!", remove_punctuation=True)
         assert "," not in result
         assert "!" not in result
         assert "தமிழ்" in result
         assert "மொழி" in result
+        assert result == "தமிழ் மொழி"
     
-    def test_clean_text_without_punctuation_removal(self):
+    def test_clean_text_without_punctuation_removal(self, tokenizer):
         """Test cleaning text without punctuation removal."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.clean_text("தமிழ், மொழி!", remove_punctuation=False)
         assert "," in result
         assert "!" in result
-    
-    def test_convenience_function(self):
-        """Test convenience function for text cleaning."""
-        result = clean_text("தமிழ்   மொழி")
-        assert result == "தமிழ் மொழி"
 
 
 class TestTextNormalization:
     """Test text normalization functionality."""
     
-    def test_normalize_text(self):
+    def test_normalize_text(self, tokenizer):
         """Test text normalization."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.normalize_text("  தமிழ்   மொழி  ")
         assert result == "தமிழ் மொழி"
-    
-    def test_convenience_function(self):
-        """Test convenience function for text normalization."""
-        result = normalize_text("  தமிழ்   மொழி  ")
-        assert result == "தமிழ் மொழி"
+
+
+class TestNormalizationEquivalence:
+    """Test that NFC and NFD input tokenize identically."""
+    
+    def test_nfc_nfd_equivalence(self, tokenizer):
+        """Test tokenization of precomposed and decomposed vowel signs."""
+        s_nfc = unicodedata.normalize("NFC", "கௌரவம்")
+        s_nfd = unicodedata.normalize("NFD", "கௌரவம்")
+        assert s_nfc != s_nfd
+        assert tokenizer.tokenize_characters(s_nfc) == tokenizer.tokenize_characters(s_nfd)
+        assert tokenizer.tokenize_words(s_nfc + " மொழி") == tokenizer.tokenize_words(s_nfd + " மொழி")
+        assert tokenizer.tokenize_syllables(s_nfc) == tokenizer.tokenize_syllables(s_nfd)
+    
+    def test_analyze_word_structure_nfc_nfd_equivalence(self, tokenizer):
+        """Test that word structure analysis composes decomposed input."""
+        s_nfc = unicodedata.normalize("NFC", "கௌரவம்")
+        s_nfd = unicodedata.normalize("NFD", "கௌரவம்")
+        result = tokenizer.analyze_word_structure(s_nfd)
+        assert result == tokenizer.analyze_word_structure(s_nfc)
+        assert result['characters'] == tokenizer.tokenize_characters(s_nfd)
+        assert result['syllables'] == tokenizer.tokenize_syllables(s_nfd)
+        assert result['syllables'][0] == "க\u0BCC"
+    
+    def test_validate_text_returns_nfc(self, tokenizer):
+        """Test that validated text is in NFC form."""
+        s_nfd = unicodedata.normalize("NFD", "கௌரவம்")
+        assert tokenizer._validate_text(s_nfd) == unicodedata.normalize("NFC", s_nfd)
+    
+    def test_normalize_text_keeps_requested_form(self, tokenizer):
+        """Test that normalize_text output stays in the requested form."""
+        s_nfc = unicodedata.normalize("NFC", "கௌரவம்")
+        result = tokenizer.normalize_text(s_nfc, form="NFD")
+        assert result == unicodedata.normalize("NFD", s_nfc)
+
+
+@pytest.mark.parametrize(
+    "function,text,check",
+    [
+        (tokenize_words, "தமிழ் மொழி", lambda r: len(r) == 2 and "தமிழ்" in r and "மொழி" in r),
+        (tokenize_sentences, "வணக்கம். நலமா?", lambda r: len(r) == 2),
+        (tokenize_characters, "தமிழ்", lambda r: len(r) >= 3),  # At least த, ம, ழ்
+        (clean_text, "தமிழ்   மொழி", lambda r: r == "தமிழ் மொழி"),
+        (normalize_text, "  தமிழ்   மொழி  ", lambda r: r == "தமிழ் மொழி"),
+    ],
+    ids=["words", "sentences", "characters", "clean_text", "normalize_text"],
+)
+def test_convenience_function(function, text, check):
+    """Test the module-level convenience functions."""
+    assert check(function(text))
 
 
 class TestSyllableTokenization:
     """Test syllable tokenization functionality (New in v0.1.1)."""
     
-    def test_simple_syllable_tokenization(self):
+    def test_simple_syllable_tokenization(self, tokenizer):
         """Test simple syllable tokenization."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize_syllables("தமிழ்")
         assert len(result) >= 2  # At least த, மிழ்
         assert any("த" in syl for syl in result)
     
-    def test_syllables_with_vowel_signs(self):
+    def test_syllables_with_vowel_signs(self, tokenizer):
         """Test syllable tokenization with vowel signs."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize_syllables("தமிழ்")
         assert len(result) > 0
         # Should handle Tamil syllable patterns properly
@@ -223,24 +292,56 @@ class TestSyllableTokenization:
         result = tokenize_syllables("தமிழ்")
         assert len(result) > 0
         assert all(isinstance(syl, str) for syl in result)
+    
+    def test_syllables_keep_virama(self, tokenizer):
+        """Test that virama-joined consonants and a final virama stay in their syllable."""
+        assert tokenizer.tokenize_syllables("பக்கம்") == ["ப", "க்க", "ம்"]
+        assert tokenizer.tokenize_syllables("அம்மா") == ["அ", "ம்மா"]
 
 
 class TestGraphemeTokenization:
     """Test grapheme cluster tokenization functionality (New in v0.1.1)."""
     
-    def test_simple_grapheme_tokenization(self):
+    def test_simple_grapheme_tokenization(self, tokenizer):
         """Test simple grapheme tokenization."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize_graphemes("தமிழ்")
         assert len(result) >= 3  # Logical Tamil characters
         assert "த" in result
     
-    def test_graphemes_with_conjuncts(self):
+    def test_graphemes_with_conjuncts(self, tokenizer):
         """Test grapheme tokenization with conjunct consonants."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize_graphemes("க்ஷ")  # Conjunct
         assert len(result) > 0
         # Should handle conjuncts as single graphemes
+        assert result == ["க்ஷ"]
+        assert tokenizer.tokenize_graphemes("ஸ்ரீ") == ["ஸ்ரீ"]
+    
+    def test_graphemes_with_trailing_marks(self, tokenizer):
+        """Test that a final virama and two-part vowel signs stay with their base."""
+        assert tokenizer.tokenize_graphemes("தமிழ்") == ["த", "மி", "ழ்"]
+        # கௌ written as க + ெ + ௗ is one grapheme, composed to NFC
+        assert tokenizer.tokenize_graphemes("க\u0BC6\u0BD7") == ["க\u0BCC"]
+    
+    def test_graphemes_vowel_with_trailing_marks(self, tokenizer):
+        """Test that marks after an independent vowel stay with the vowel."""
+        assert tokenizer.tokenize_graphemes("அ\u0BCD") == ["அ\u0BCD"]
+        assert tokenizer.tokenize_graphemes("ஔ\u0BBF") == ["ஔ\u0BBF"]
+    
+    def test_graphemes_with_zero_width_non_joiner(self, tokenizer):
+        """Test that ZWNJ after a virama breaks the conjunct."""
+        result = tokenizer.tokenize_graphemes("க்\u200Cஷ")
+        assert result == ["க்", "ஷ"]
+    
+    def test_grapheme_consonant_cluster(self, tokenizer):
+        """Test that a virama ends a cluster unless it forms a Tamil conjunct."""
+        assert tokenizer.tokenize_graphemes("க்ஷ்மி") == ["க்ஷ்", "மி"]
+        assert tokenizer.tokenize_graphemes("பக்கம்") == ["ப", "க்", "க", "ம்"]
+        assert tokenizer.tokenize_graphemes("அம்மா") == ["அ", "ம்", "மா"]
+    
+    def test_grapheme_regex_compiled_once(self, tokenizer):
+        """Test that every tokenizer shares the module-level grapheme pattern."""
+        assert tokenizer.grapheme_pattern is core._GRAPHEME_RE
+        assert TamilTokenizer().grapheme_pattern is core._GRAPHEME_RE
     
     def test_convenience_function(self):
         """Test convenience function for grapheme tokenization."""
@@ -252,9 +353,8 @@ class TestGraphemeTokenization:
 class TestWordStructureAnalysis:
     """Test word structure analysis functionality (New in v0.1.1)."""
     
-    def test_tamil_word_analysis(self):
+    def test_tamil_word_analysis(self, tokenizer):
         """Test analysis of Tamil word structure."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.analyze_word_structure("தமிழ்")
         
         assert result['is_tamil'] == True
@@ -265,9 +365,8 @@ class TestWordStructureAnalysis:
         assert isinstance(result['characters'], list)
         assert isinstance(result['syllables'], list)
     
-    def test_non_tamil_word_analysis(self):
+    def test_non_tamil_word_analysis(self, tokenizer):
         """Test analysis of non-Tamil word."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.analyze_word_structure("hello")
         
         assert result['is_tamil'] == False
@@ -278,52 +377,65 @@ class TestWordStructureAnalysis:
         assert result['characters'] == []
         assert result['syllables'] == []
     
-    def test_word_with_vowel_signs(self):
+    def test_word_with_vowel_signs(self, tokenizer):
         """Test analysis of word with vowel signs."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.analyze_word_structure("தமிழ்")
         
         assert result['is_tamil'] == True
         # தமிழ் has vowel sign 'ி'
         assert result['has_vowel_signs'] == True
+    
+    def test_word_conjunct_and_vowel_sign_flags(self, tokenizer):
+        """Test conjunct and vowel sign detection on specific words."""
+        # A final virama is not a conjunct
+        result = tokenizer.analyze_word_structure("தமிழ்")
+        assert result['has_conjuncts'] == False
+        
+        result = tokenizer.analyze_word_structure("க்ஷ")
+        assert result['has_conjuncts'] == True
+        assert result['has_vowel_signs'] == False
+        
+        # The au length mark ௗ counts as a vowel sign
+        result = tokenizer.analyze_word_structure("க\u0BC6\u0BD7")
+        assert result['has_vowel_signs'] == True
 
 
 class TestGeneralTokenization:
     """Test general tokenization method."""
     
-    def test_tokenize_words_method(self):
+    @pytest.mark.parametrize("method", ["words", "sentences", "characters", "syllables", "graphemes"])
+    def test_tokenize_uses_precompiled_patterns(self, tokenizer, regex_compile_calls, method):
+        """Test that no tokenization method compiles patterns per call."""
+        tokenizer.tokenize("வணக்கம். தமிழ் மொழி அழகான மொழி!", method)
+        assert regex_compile_calls == []
+    
+    def test_tokenize_words_method(self, tokenizer):
         """Test general tokenize method with words."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize("தமிழ் மொழி", "words")
         assert len(result) == 2
     
-    def test_tokenize_sentences_method(self):
+    def test_tokenize_sentences_method(self, tokenizer):
         """Test general tokenize method with sentences."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize("வணக்கம். நலமா?", "sentences")
         assert len(result) == 2
     
-    def test_tokenize_characters_method(self):
+    def test_tokenize_characters_method(self, tokenizer):
         """Test general tokenize method with characters."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize("தமிழ்", "characters")
         assert len(result) >= 3
     
-    def test_tokenize_syllables_method(self):
+    def test_tokenize_syllables_method(self, tokenizer):
         """Test general tokenize method with syllables."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize("தமிழ்", "syllables")
         assert len(result) > 0
     
-    def test_tokenize_graphemes_method(self):
+    def test_tokenize_graphemes_method(self, tokenizer):
         """Test general tokenize method with graphemes."""
-        tokenizer = TamilTokenizer()
         result = tokenizer.tokenize("தமிழ்", "graphemes")
         assert len(result) > 0
     
-    def test_invalid_tokenization_method(self):
+    def test_invalid_tokenization_method(self, tokenizer):
         """Test invalid tokenization method."""
-        tokenizer = TamilTokenizer()
         with pytest.raises(TokenizationError):
             tokenizer.tokenize("தமிழ்", "invalid_method")
 
@@ -331,9 +443,8 @@ class TestGeneralTokenization:
 class TestStatistics:
     """Test statistics functionality."""
     
-    def test_get_statistics(self):
+    def test_get_statistics(self, tokenizer):
         """Test getting text statistics."""
-        tokenizer = TamilTokenizer()
         stats = tokenizer.get_statistics("தமிழ் மொழி அழகான மொழி.")
         
         assert 'total_characters' in stats
@@ -346,21 +457,91 @@ class TestStatistics:
         assert stats['words'] > 0
         assert stats['tamil_characters'] > 0
     
-    def test_statistics_with_empty_result(self):
+    def test_statistics_with_empty_result(self, tokenizer):
         """Test statistics with text that has no Tamil characters."""
-        tokenizer = TamilTokenizer()
         # This should still work but have 0 Tamil characters
         stats = tokenizer.get_statistics("Hello World!")
         assert stats['tamil_characters'] == 0
+    
+    def test_statistics_syllable_count(self, tokenizer):
+        """Test the syllable count for words with medial and final viramas."""
+        assert tokenizer.get_statistics("பக்கம்")['syllables'] == 3
+        assert tokenizer.get_statistics("பக்கம் அம்மா")['syllables'] == 5
+    
+    def test_statistics_is_cached(self, tokenizer):
+        """Test that repeated statistics for the same text come from the cache."""
+        text = "தமிழ் மொழி அழகான மொழி. வணக்கம்!"
+        first = tokenizer.get_statistics(text)
+        hits = core._cached_statistics.cache_info().hits
+        
+        second = tokenizer.get_statistics("  " + text + "  ")
+        assert core._cached_statistics.cache_info().hits == hits + 1
+        assert second == first
+        
+        # Callers get their own copy of the cached result
+        second['words'] = -1
+        assert tokenizer.get_statistics(text)['words'] == first['words']
+    
+    def test_statistics_respect_instance_overrides(self):
+        """Test that subclasses and replaced patterns are not served from the shared cache."""
+        text = "தமிழ் மொழி அழகான மொழி."
+        TamilTokenizer().get_statistics(text)
+        
+        class SingleWordTokenizer(TamilTokenizer):
+            def _tokenize_words_nocheck(self, text):
+                return [text]
+        
+        assert SingleWordTokenizer().get_statistics(text)['words'] == 1
+        
+        custom = TamilTokenizer()
+        custom.word_pattern = re.compile(r'\S+')
+        assert custom.get_statistics(text)['words'] == 4
+        assert TamilTokenizer().get_statistics(text)['words'] == 5
+        
+        # Patterns that statistics do not use leave the cache available
+        graphemes_only = TamilTokenizer()
+        graphemes_only.grapheme_pattern = re.compile(r'.')
+        hits = core._cached_statistics.cache_info().hits
+        graphemes_only.get_statistics(text)
+        assert core._cached_statistics.cache_info().hits == hits + 1
+    
+    def test_statistics_cache_guard_covers_read_patterns(self):
+        """Test that the cache guard checks exactly the patterns statistics read."""
+        read = set()
+        
+        class RecordingTokenizer(TamilTokenizer):
+            def __getattribute__(self, name):
+                if name in TamilTokenizer.__slots__:
+                    read.add(name)
+                return super().__getattribute__(name)
+        
+        RecordingTokenizer()._get_statistics_nocheck("தமிழ் மொழி அழகான மொழி. வணக்கம்!")
+        assert read == set(TamilTokenizer._STATISTICS_PATTERNS)
+        assert TamilTokenizer()._has_default_statistics_patterns()
+    
+    def test_statistics_large_input(self, tokenizer):
+        """Test statistics on about 1 MB of Tamil text."""
+        text = "தமிழ் மொழி அழகான மொழி. வணக்கம் நண்பா! " * 10500
+        assert len(text.encode("utf-8")) >= 1_000_000
+        
+        currsize = core._cached_statistics.cache_info().currsize
+        start = time.perf_counter()
+        stats = tokenizer.get_statistics(text)
+        elapsed = time.perf_counter() - start
+        
+        assert stats['words'] == 84000  # 6 words and 2 punctuation tokens per repeat
+        assert stats['sentences'] == 21000
+        assert elapsed < 1.0
+        
+        # Large documents bypass the statistics cache
+        assert core._cached_statistics.cache_info().currsize == currsize
 
 
 class TestErrorHandling:
     """Test error handling."""
     
-    def test_tokenization_error_propagation(self):
+    def test_tokenization_error_propagation(self, tokenizer):
         """Test that tokenization errors are properly propagated."""
-        tokenizer = TamilTokenizer()
-        
         with pytest.raises(InvalidTextError):
             tokenizer.tokenize_words("")
         
@@ -371,5 +552,19 @@ class TestErrorHandling:
             tokenizer.tokenize_characters("   ")
 
 
+class TestScaling:
+    """Test tokenization on large inputs."""
+    
+    def test_large_input_words(self):
+        """Test word tokenization of a large text stays linear and fast."""
+        text = "தமிழ் மொழி அழகான மொழி " * 10000
+        start = time.perf_counter()
+        result = tokenize_words(text)
+        elapsed = time.perf_counter() - start
+        
+        assert len(result) == 40000
+        assert elapsed < 0.2
+
+
 if __name__ == '__main__':
     pytest.main([__file__])